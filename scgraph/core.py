@@ -1,4 +1,14 @@
-from .utils import haversine, hard_round, distance_converter, get_line_path
+from .utils import (
+    haversine,
+    haversine_many,
+    hard_round,
+    distance_converter,
+    get_line_path,
+)
+from heapq import heappop, heappush, heapify
+from bisect import bisect_left, bisect_right
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import json
 
 
@@ -19,7 +29,7 @@ class Graph:
         - `graph`:
             - Type: list of dictionaries
             - See: https://connor-makowski.github.io/scgraph/scgraph/core.html#GeoGraph
-        
+
         Optional Arguments:
 
         - `check_symmetry`
@@ -37,26 +47,38 @@ class Graph:
         check_symmetry = check_symmetry or check_connected
         assert isinstance(graph, list), "Your graph must be a list"
         len_graph = len(graph)
+        # Count arcs pointing up (destination > origin) and down (destination < origin)
+        # Each undirected arc is only checked once (from its lower id), so the
+        # counts must match to guarantee that no down arc is missing its pair
+        upward_arcs = 0
+        downward_arcs = 0
         for origin_id, origin_dict in enumerate(graph):
             assert isinstance(
                 origin_dict, dict
             ), f"Your graph must be a dictionary of dictionaries but the value for origin {origin_id} is not a dictionary"
-            destinations = list(origin_dict.keys())
-            lengths = list(origin_dict.values())
-            assert all(
-                [
-                    (isinstance(i, int) and i >= 0 and i < len_graph)
-                    for i in destinations
-                ]
-            ), f"Destination ids must be non-negative integers and equivalent to an existing index, but graph[{origin_id}] has an error in the destination ids"
-            assert all(
-                [(isinstance(i, (int, float)) and i >= 0) for i in lengths]
-            ), f"Distances must be integers or floats, but graph[{origin_id}] contains a non-integer or non-float distance"
-            if check_symmetry:
-                for destination_id, distance in origin_dict.items():
-                    assert (
-                        graph[destination_id].get(origin_id) == distance
-                    ), f"Your graph is not symmetric, the distance from node {origin_id} to node {destination_id} is {distance} but the distance from node {destination_id} to node {origin_id} is {graph.get(destination_id, {}).get(origin_id)}"
+            # Check every arc in a single pass without building intermediate lists
+            for destination_id, distance in origin_dict.items():
+                assert (
+                    isinstance(destination_id, int)
+                    and 0 <= destination_id < len_graph
+                ), f"Destination ids must be non-negative integers and equivalent to an existing index, but graph[{origin_id}] has an error in the destination ids"
+                assert (
+                    isinstance(distance, (int, float)) and distance >= 0
+                ), f"Distances must be integers or floats, but graph[{origin_id}] contains a non-integer or non-float distance"
+                if not check_symmetry:
+                    continue
+                if destination_id <= origin_id:
+                    if destination_id < origin_id:
+                        downward_arcs += 1
+                    continue
+                upward_arcs += 1
+                assert (
+                    graph[destination_id].get(origin_id) == distance
+                ), f"Your graph is not symmetric, the distance from node {origin_id} to node {destination_id} is {distance} but the distance from node {destination_id} to node {origin_id} is {graph[destination_id].get(origin_id)}"
+        if check_symmetry:
+            assert (
+                upward_arcs == downward_arcs
+            ), "Your graph is not symmetric, at least one arc does not have a matching arc in the opposite direction"
         if check_connected:
             assert Graph.validate_connected(
                 graph
@@ -83,29 +105,21 @@ class Graph:
         - None
         """
         origin_id = 0
-        destination_id = len(graph) + 1
-
-        distance_matrix = [float("inf") for i in graph]
-        open_leaves = {}
-        predecessor = [None for i in graph]
-
-        distance_matrix[origin_id] = 0
-        open_leaves[origin_id] = 0
-
-        while True:
-            if len(open_leaves) == 0:
-                return max(distance_matrix) != float("inf")
-            current_id = min(open_leaves, key=open_leaves.get)
-            open_leaves.pop(current_id)
-            if current_id == destination_id:
-                break
-            current_distance = distance_matrix[current_id]
-            for connected_id, connected_distance in graph[current_id].items():
-                possible_distance = current_distance + connected_distance
-                if possible_distance < distance_matrix[connected_id]:
-                    distance_matrix[connected_id] = possible_distance
-                    predecessor[connected_id] = current_id
-                    open_leaves[connected_id] = possible_distance
+        # Connectivity does not depend on distances, so a breadth first search
+        # that counts the reached nodes is sufficient
+        reached = bytearray(len(graph))
+        reached[origin_id] = 1
+        reached_count = 1
+        open_leaves = deque([origin_id])
+
+        while open_leaves:
+            current_id = open_leaves.popleft()
+            for connected_id in graph[current_id]:
+                if not reached[connected_id]:
+                    reached[connected_id] = 1
+                    reached_count += 1
+                    open_leaves.append(connected_id)
+        return reached_count == len(graph)
 
     @staticmethod
     def input_check(
@@ -133,16 +147,10 @@ class Graph:
 
         - None
         """
-        if (
-            not isinstance(origin_id, int)
-            and origin_id < len(graph)
-            and origin_id >= 0
-        ):
+        if not (isinstance(origin_id, int) and 0 <= origin_id < len(graph)):
             raise Exception(f"Origin node ({origin_id}) is not in the graph")
-        if (
-            not isinstance(destination_id, int)
-            and origin_id < len(graph)
-            and origin_id >= 0
+        if not (
+            isinstance(destination_id, int) and 0 <= destination_id < len(graph)
         ):
             raise Exception(
                 f"Destination node ({destination_id}) is not in the graph"
@@ -158,7 +166,84 @@ class Graph:
         - Identify the shortest path between two nodes in a sparse network graph using a modified dijkstra algorithm
             - Modifications allow for a sparse distance matrix to be used instead of a dense distance matrix
             - This can dramatically reduce the memory and compute requirements of the algorithm
-            - This algorithm runs in O(n^2) time where n is the number of nodes in the graph
+            - Nodes are selected from a binary heap and marked as visited so each node is only expanded once
+            - This algorithm runs in O((n+m) log n) time where n is the number of nodes and m is the number of arcs in the graph
+        - Return a dictionary of various path information including:
+            - `id_path`: A list of node ids in the order they are visited
+            - `path`: A list of node dictionaries (lat + long) in the order they are visited
+
+        Required Arguments:
+
+        - `graph`:
+            - Type: list of dictionaries
+            - See: https://connor-makowski.github.io/scgraph/scgraph/core.html#GeoGraph
+        - `origin_id`
+            - Type: int
+            - What: The id of the origin node from the graph dictionary to start the shortest path from
+        - `destination_id`
+            - Type: int
+            - What: The id of the destination node from the graph dictionary to end the shortest path at
+
+        Optional Arguments:
+
+        - None
+        """
+        Graph.input_check(
+            graph=graph, origin_id=origin_id, destination_id=destination_id
+        )
+        distance_matrix = [float("inf")] * len(graph)
+        visited = bytearray(len(graph))
+        predecessor = [None] * len(graph)
+
+        distance_matrix[origin_id] = 0
+        open_leaves = [(0, origin_id)]
+
+        while True:
+            if len(open_leaves) == 0:
+                raise Exception(
+                    "Something went wrong, the origin and destination nodes are not connected."
+                )
+            current_distance, current_id = heappop(open_leaves)
+            # Skip heap entries for nodes that were already reached by a shorter path
+            if visited[current_id]:
+                continue
+            visited[current_id] = 1
+            if current_id == destination_id:
+                break
+            for connected_id, connected_distance in graph[current_id].items():
+                possible_distance = current_distance + connected_distance
+                if possible_distance < distance_matrix[connected_id]:
+                    distance_matrix[connected_id] = possible_distance
+                    predecessor[connected_id] = current_id
+                    heappush(open_leaves, (possible_distance, connected_id))
+
+        output_path = [current_id]
+        while predecessor[current_id] is not None:
+            current_id = predecessor[current_id]
+            output_path.append(current_id)
+
+        output_path.reverse()
+
+        return {
+            "path": output_path,
+            "length": hard_round(4, distance_matrix[destination_id]),
+        }
+
+    @staticmethod
+    def dijkstra_makowski(
+        graph: list[dict], origin_id: int, destination_id: int
+    ) -> dict:
+        """
+        Function:
+
+        - Identify the shortest path between two nodes in a sparse network graph using Makowski's modified Dijkstra algorithm
+            - Modifications allow for a sparse distance matrix to be used instead of a dense distance matrix
+            - Improvements include only computing future potential nodes based on the open leaves for each branch
+                - Open leaves are nodes that have not been visited yet but are adjacent to other visited nodes
+                - Open leaves are kept in a binary heap (`heapq`) so the closest open leaf is found in O(log n) time
+            - This can dramatically reduce the memory and compute requirements of the algorithm
+            - This algorithm runs in O((n+m) log n) time
+                - Where n is the number of nodes and m is the number of arcs in the graph
         - Return a dictionary of various path information including:
             - `id_path`: A list of node ids in the order they are visited
             - `path`: A list of node dictionaries (lat + long) in the order they are visited
@@ -182,21 +267,22 @@ class Graph:
         Graph.input_check(
             graph=graph, origin_id=origin_id, destination_id=destination_id
         )
-        distance_matrix = [float("inf") for i in graph]
-        branch_tip_distances = [float("inf") for i in graph]
-        predecessor = [None for i in graph]
+        distance_matrix = [float("inf")] * len(graph)
+        predecessor = [None] * len(graph)
 
         distance_matrix[origin_id] = 0
-        branch_tip_distances[origin_id] = 0
+        # Open leaves are stored in a heap (heapq is implemented in C)
+        # Stale entries are skipped when popped instead of being removed
+        open_leaves = [(0, origin_id)]
 
         while True:
-            current_distance = min(branch_tip_distances)
-            if current_distance == float("inf"):
+            if len(open_leaves) == 0:
                 raise Exception(
                     "Something went wrong, the origin and destination nodes are not connected."
                 )
-            current_id = branch_tip_distances.index(current_distance)
-            branch_tip_distances[current_id] = float("inf")
+            current_distance, current_id = heappop(open_leaves)
+            if current_distance > distance_matrix[current_id]:
+                continue
             if current_id == destination_id:
                 break
             for connected_id, connected_distance in graph[current_id].items():
@@ -204,7 +290,7 @@ class Graph:
                 if possible_distance < distance_matrix[connected_id]:
                     distance_matrix[connected_id] = possible_distance
                     predecessor[connected_id] = current_id
-                    branch_tip_distances[connected_id] = possible_distance
+                    heappush(open_leaves, (possible_distance, connected_id))
 
         output_path = [current_id]
         while predecessor[current_id] is not None:
@@ -219,24 +305,616 @@ class Graph:
         }
 
     @staticmethod
-    def dijkstra_makowski(
-        graph: list[dict], origin_id: int, destination_id: int
-    ) -> dict:
+    def dijkstra_bidirectional(
+        graph: list[dict], origin_id: int, destination_id: int
+    ) -> dict:
+        """
+        Function:
+
+        - Identify the shortest path between two nodes in a sparse network graph using a bidirectional dijkstra algorithm
+            - One search grows from the origin and another from the destination until their frontiers meet
+            - This typically expands about half as many nodes as `Graph.dijkstra_makowski` for point to point queries
+            - The graph must be symmetric (EG: If node A has a distance of 10 to node B, then node B has a distance of 10 to node A) as the backward search uses the same arcs as the forward search
+        - Return a dictionary of various path information including:
+            - `path`: A list of node ids in the order they are visited
+            - `length`: The length of the path
+
+        Required Arguments:
+
+        - `graph`:
+            - Type: list of dictionaries
+            - See: https://connor-makowski.github.io/scgraph/scgraph/core.html#GeoGraph
+        - `origin_id`
+            - Type: int
+            - What: The id of the origin node from the graph dictionary to start the shortest path from
+        - `destination_id`
+            - Type: int
+            - What: The id of the destination node from the graph dictionary to end the shortest path at
+
+        Optional Arguments:
+
+        - None
+        """
+        Graph.input_check(
+            graph=graph, origin_id=origin_id, destination_id=destination_id
+        )
+        forward_distances = [float("inf")] * len(graph)
+        backward_distances = [float("inf")] * len(graph)
+        forward_predecessor = [None] * len(graph)
+        backward_predecessor = [None] * len(graph)
+
+        forward_distances[origin_id] = 0
+        backward_distances[destination_id] = 0
+        forward_leaves = [(0, origin_id)]
+        backward_leaves = [(0, destination_id)]
+
+        # The shortest origin to destination distance found so far and the node where it meets
+        best_distance = 0 if origin_id == destination_id else float("inf")
+        meeting_id = origin_id
+
+        # Stop once no unexpanded pair of frontier nodes can improve on the best distance
+        while (
+            forward_leaves
+            and backward_leaves
+            and forward_leaves[0][0] + backward_leaves[0][0] < best_distance
+        ):
+            # Expand the side with the closer frontier to keep both searches balanced
+            if forward_leaves[0][0] <= backward_leaves[0][0]:
+                open_leaves = forward_leaves
+                distance_matrix = forward_distances
+                other_distance_matrix = backward_distances
+                predecessor = forward_predecessor
+            else:
+                open_leaves = backward_leaves
+                distance_matrix = backward_distances
+                other_distance_matrix = forward_distances
+                predecessor = backward_predecessor
+            current_distance, current_id = heappop(open_leaves)
+            if current_distance > distance_matrix[current_id]:
+                continue
+            for connected_id, connected_distance in graph[current_id].items():
+                possible_distance = current_distance + connected_distance
+                if possible_distance < distance_matrix[connected_id]:
+                    distance_matrix[connected_id] = possible_distance
+                    predecessor[connected_id] = current_id
+                    heappush(open_leaves, (possible_distance, connected_id))
+                    meeting_distance = (
+                        possible_distance + other_distance_matrix[connected_id]
+                    )
+                    if meeting_distance < best_distance:
+                        best_distance = meeting_distance
+                        meeting_id = connected_id
+
+        if best_distance == float("inf"):
+            raise Exception(
+                "Something went wrong, the origin and destination nodes are not connected."
+            )
+
+        current_id = meeting_id
+        output_path = [current_id]
+        while forward_predecessor[current_id] is not None:
+            current_id = forward_predecessor[current_id]
+            output_path.append(current_id)
+        output_path.reverse()
+        current_id = meeting_id
+        while backward_predecessor[current_id] is not None:
+            current_id = backward_predecessor[current_id]
+            output_path.append(current_id)
+
+        return {
+            "path": output_path,
+            "length": hard_round(4, best_distance),
+        }
+
+    @staticmethod
+    def contraction_hierarchy(
+        graph: list[dict], witness_settle_limit: int = 50
+    ) -> dict:
+        """
+        Function:
+
+        - Preprocess a graph into a contraction hierarchy for use with `Graph.dijkstra_contraction_hierarchy`
+            - Nodes are contracted one at a time, starting with the nodes that add the fewest shortcut arcs
+            - When a node is contracted, a shortcut arc is added between each pair of its remaining neighbors unless a path of equal or shorter length (a witness) exists without it
+            - This is slow to compute, but it makes each later shortest path query much faster on static graphs
+            - The graph must be symmetric (EG: If node A has a distance of 10 to node B, then node B has a distance of 10 to node A)
+        - Return a dictionary of contraction hierarchy information including:
+            - `upward_graph`: A list where each index holds a dictionary of the arcs (including shortcuts) from that node to nodes that were contracted after it
+            - `shortcut_via`: A dictionary of the contracted node that each shortcut arc (origin_id, destination_id) passes through
+
+        Required Arguments:
+
+        - `graph`:
+            - Type: list of dictionaries
+            - See: https://connor-makowski.github.io/scgraph/scgraph/core.html#GeoGraph
+
+        Optional Arguments:
+
+        - `witness_settle_limit`
+            - Type: int
+            - What: The maximum number of nodes to settle in each witness search
+            - Default: 50
+            - Note: Lower values are faster to preprocess but may add unnecessary shortcuts (results are still exact)
+        """
+        node_count = len(graph)
+        remaining_graph = [dict(arcs) for arcs in graph]
+        for node_id, arcs in enumerate(remaining_graph):
+            arcs.pop(node_id, None)
+        upward_graph = [None] * node_count
+        shortcut_via = {}
+        contracted_neighbors = [0] * node_count
+
+        def get_shortcuts(node_id):
+            neighbors = list(remaining_graph[node_id].items())
+            shortcuts = []
+            for idx, (source_id, source_distance) in enumerate(neighbors):
+                targets = neighbors[idx + 1 :]
+                if len(targets) == 0:
+                    continue
+                max_distance = source_distance + max(
+                    target_distance for _, target_distance in targets
+                )
+                # Search for witness paths that avoid the node being contracted
+                witness_distances = {source_id: 0}
+                open_leaves = [(0, source_id)]
+                settled_count = 0
+                while open_leaves and settled_count < witness_settle_limit:
+                    current_distance, current_id = heappop(open_leaves)
+                    if current_distance > witness_distances[current_id]:
+                        continue
+                    if current_distance > max_distance:
+                        break
+                    settled_count += 1
+                    for connected_id, connected_distance in remaining_graph[
+                        current_id
+                    ].items():
+                        if connected_id == node_id:
+                            continue
+                        possible_distance = (
+                            current_distance + connected_distance
+                        )
+                        if possible_distance < witness_distances.get(
+                            connected_id, float("inf")
+                        ):
+                            witness_distances[connected_id] = possible_distance
+                            heappush(
+                                open_leaves, (possible_distance, connected_id)
+                            )
+                for target_id, target_distance in targets:
+                    via_distance = source_distance + target_distance
+                    if (
+                        witness_distances.get(target_id, float("inf"))
+                        > via_distance
+                    ):
+                        shortcuts.append((source_id, target_id, via_distance))
+            return shortcuts
+
+        def get_priority(node_id, shortcuts):
+            # Edge difference plus the number of already contracted neighbors
+            return (
+                len(shortcuts)
+                - len(remaining_graph[node_id])
+                + contracted_neighbors[node_id]
+            )
+
+        contraction_queue = [
+            (get_priority(node_id, get_shortcuts(node_id)), node_id)
+            for node_id in range(node_count)
+        ]
+        heapify(contraction_queue)
+        while contraction_queue:
+            _, node_id = heappop(contraction_queue)
+            # Priorities are updated lazily when a node reaches the top of the queue
+            shortcuts = get_shortcuts(node_id)
+            priority = get_priority(node_id, shortcuts)
+            if contraction_queue and priority > contraction_queue[0][0]:
+                heappush(contraction_queue, (priority, node_id))
+                continue
+            upward_graph[node_id] = remaining_graph[node_id]
+            for neighbor_id in remaining_graph[node_id]:
+                del remaining_graph[neighbor_id][node_id]
+                contracted_neighbors[neighbor_id] += 1
+            for source_id, target_id, distance in shortcuts:
+                if distance < remaining_graph[source_id].get(
+                    target_id, float("inf")
+                ):
+                    remaining_graph[source_id][target_id] = distance
+                    remaining_graph[target_id][source_id] = distance
+                    shortcut_via[(source_id, target_id)] = node_id
+                    shortcut_via[(target_id, source_id)] = node_id
+
+        return {"upward_graph": upward_graph, "shortcut_via": shortcut_via}
+
+    @staticmethod
+    def dijkstra_contraction_hierarchy(
+        graph: list[dict],
+        origin_id: int,
+        destination_id: int,
+        contraction_hierarchy: dict,
+    ) -> dict:
+        """
+        Function:
+
+        - Identify the shortest path between two nodes in a sparse network graph using a precomputed contraction hierarchy
+            - A bidirectional dijkstra search is run where both sides only follow arcs to nodes that were contracted later
+            - Shortcut arcs in the result are expanded back into the original arcs
+            - Nodes in `graph` that are not in the contraction hierarchy (EG: origin and destination nodes added by `GeoGraph.get_shortest_path`) are treated as if they were contracted first
+        - Return a dictionary of various path information including:
+            - `path`: A list of node ids in the order they are visited
+            - `length`: The length of the path
+
+        Required Arguments:
+
+        - `graph`:
+            - Type: list of dictionaries
+            - See: https://connor-makowski.github.io/scgraph/scgraph/core.html#GeoGraph
+        - `origin_id`
+            - Type: int
+            - What: The id of the origin node from the graph dictionary to start the shortest path from
+        - `destination_id`
+            - Type: int
+            - What: The id of the destination node from the graph dictionary to end the shortest path at
+        - `contraction_hierarchy`
+            - Type: dict
+            - What: The output of `Graph.contraction_hierarchy` for this graph
+
+        Optional Arguments:
+
+        - None
+        """
+        Graph.input_check(
+            graph=graph, origin_id=origin_id, destination_id=destination_id
+        )
+        upward_graph = contraction_hierarchy["upward_graph"]
+        shortcut_via = contraction_hierarchy["shortcut_via"]
+        node_count = len(upward_graph)
+        # Only a small part of the graph is searched so state is kept in dictionaries
+        forward_distances = {origin_id: 0}
+        backward_distances = {destination_id: 0}
+        forward_predecessor = {origin_id: None}
+        backward_predecessor = {destination_id: None}
+        forward_leaves = [(0, origin_id)]
+        backward_leaves = [(0, destination_id)]
+
+        best_distance = 0 if origin_id == destination_id else float("inf")
+        meeting_id = origin_id
+
+        while True:
+            forward_top = (
+                forward_leaves[0][0] if forward_leaves else float("inf")
+            )
+            backward_top = (
+                backward_leaves[0][0] if backward_leaves else float("inf")
+            )
+            # Stop once neither side can still find a shorter meeting point
+            if min(forward_top, backward_top) >= best_distance:
+                break
+            if forward_top <= backward_top:
+                open_leaves = forward_leaves
+                distance_matrix = forward_distances
+                other_distance_matrix = backward_distances
+                predecessor = forward_predecessor
+            else:
+                open_leaves = backward_leaves
+                distance_matrix = backward_distances
+                other_distance_matrix = forward_distances
+                predecessor = backward_predecessor
+            current_distance, current_id = heappop(open_leaves)
+            if current_distance > distance_matrix[current_id]:
+                continue
+            if current_id < node_count:
+                upward_arcs = upward_graph[current_id].items()
+            else:
+                upward_arcs = [
+                    (connected_id, connected_distance)
+                    for connected_id, connected_distance in graph[
+                        current_id
+                    ].items()
+                    if connected_id < node_count or connected_id > current_id
+                ]
+            for connected_id, connected_distance in upward_arcs:
+                possible_distance = current_distance + connected_distance
+                if possible_distance < distance_matrix.get(
+                    connected_id, float("inf")
+                ):
+                    distance_matrix[connected_id] = possible_distance
+                    predecessor[connected_id] = current_id
+                    heappush(open_leaves, (possible_distance, connected_id))
+                    if connected_id in other_distance_matrix:
+                        meeting_distance = (
+                            possible_distance
+                            + other_distance_matrix[connected_id]
+                        )
+                        if meeting_distance < best_distance:
+                            best_distance = meeting_distance
+                            meeting_id = connected_id
+
+        if best_distance == float("inf"):
+            raise Exception(
+                "Something went wrong, the origin and destination nodes are not connected."
+            )
+
+        current_id = meeting_id
+        shortcut_path = [current_id]
+        while forward_predecessor[current_id] is not None:
+            current_id = forward_predecessor[current_id]
+            shortcut_path.append(current_id)
+        shortcut_path.reverse()
+        current_id = meeting_id
+        while backward_predecessor[current_id] is not None:
+            current_id = backward_predecessor[current_id]
+            shortcut_path.append(current_id)
+
+        # Expand each shortcut arc into the arcs it replaced
+        output_path = [shortcut_path[0]]
+        for arc in zip(shortcut_path, shortcut_path[1:]):
+            open_arcs = [arc]
+            while open_arcs:
+                arc_origin_id, arc_destination_id = open_arcs.pop()
+                via_id = shortcut_via.get((arc_origin_id, arc_destination_id))
+                if via_id is None:
+                    output_path.append(arc_destination_id)
+                else:
+                    open_arcs.append((via_id, arc_destination_id))
+                    open_arcs.append((arc_origin_id, via_id))
+
+        return {
+            "path": output_path,
+            "length": hard_round(4, best_distance),
+        }
+
+    @staticmethod
+    def a_star(
+        graph: list[dict],
+        origin_id: int,
+        destination_id: int,
+        heuristic_fn=None,
+    ) -> dict:
+        """
+        Function:
+
+        - Identify the shortest path between two nodes in a sparse network graph using an A* algorithm
+            - Open leaves are prioritized by their current distance plus a heuristic estimate of the remaining distance to the destination
+            - The heuristic is only evaluated once per node as the destination is fixed for each call
+            - If the heuristic never overestimates the remaining distance, the returned path is the shortest path
+            - If no heuristic is passed, this is equivalent to `Graph.dijkstra_makowski`
+        - Return a dictionary of various path information including:
+            - `path`: A list of node ids in the order they are visited
+            - `length`: The length of the path
+
+        Required Arguments:
+
+        - `graph`:
+            - Type: list of dictionaries
+            - See: https://connor-makowski.github.io/scgraph/scgraph/core.html#GeoGraph
+        - `origin_id`
+            - Type: int
+            - What: The id of the origin node from the graph dictionary to start the shortest path from
+        - `destination_id`
+            - Type: int
+            - What: The id of the destination node from the graph dictionary to end the shortest path at
+
+        Optional Arguments:
+
+        - `heuristic_fn`
+            - Type: function | method
+            - What: A function that takes `origin_id` and `destination_id` and returns an estimate of the distance between them
+            - Default: None
+            - Note: See `GeoGraph.haversine` for a heuristic that can be used with geographs
+        """
+        Graph.input_check(
+            graph=graph, origin_id=origin_id, destination_id=destination_id
+        )
+        if heuristic_fn is None:
+            heuristic_fn = lambda origin_id, destination_id: 0
+        distance_matrix = [float("inf")] * len(graph)
+        predecessor = [None] * len(graph)
+        # Heuristic values are cached per node since the destination never changes
+        heuristic_matrix = [None] * len(graph)
+
+        distance_matrix[origin_id] = 0
+        heuristic_matrix[origin_id] = heuristic_fn(origin_id, destination_id)
+        open_leaves = [(heuristic_matrix[origin_id], origin_id)]
+
+        while True:
+            if len(open_leaves) == 0:
+                raise Exception(
+                    "Something went wrong, the origin and destination nodes are not connected."
+                )
+            current_priority, current_id = heappop(open_leaves)
+            if current_id == destination_id:
+                break
+            current_distance = distance_matrix[current_id]
+            if (
+                current_priority
+                > current_distance + heuristic_matrix[current_id]
+            ):
+                continue
+            for connected_id, connected_distance in graph[current_id].items():
+                possible_distance = current_distance + connected_distance
+                if possible_distance < distance_matrix[connected_id]:
+                    distance_matrix[connected_id] = possible_distance
+                    predecessor[connected_id] = current_id
+                    connected_heuristic = heuristic_matrix[connected_id]
+                    if connected_heuristic is None:
+                        connected_heuristic = heuristic_fn(
+                            connected_id, destination_id
+                        )
+                        heuristic_matrix[connected_id] = connected_heuristic
+                    heappush(
+                        open_leaves,
+                        (possible_distance + connected_heuristic, connected_id),
+                    )
+
+        output_path = [current_id]
+        while predecessor[current_id] is not None:
+            current_id = predecessor[current_id]
+            output_path.append(current_id)
+
+        output_path.reverse()
+
+        return {
+            "path": output_path,
+            "length": hard_round(4, distance_matrix[destination_id]),
+        }
+
+    @staticmethod
+    def shortest_path_tree(graph: list[dict], origin_id: int) -> dict:
+        """
+        Function:
+
+        - Identify the shortest path from an origin node to every other node in a sparse network graph
+            - This uses the same heap based search as `Graph.dijkstra_makowski` but does not stop at a destination
+        - Return a dictionary of various shortest path tree information including:
+            - `origin_id`: The id of the origin node
+            - `predecessor`: A list where each index holds the previous node id on the shortest path from the origin (None for the origin and unreachable nodes)
+            - `distance_matrix`: A list where each index holds the shortest distance from the origin (float("inf") for unreachable nodes)
+
+        Required Arguments:
+
+        - `graph`:
+            - Type: list of dictionaries
+            - See: https://connor-makowski.github.io/scgraph/scgraph/core.html#GeoGraph
+        - `origin_id`
+            - Type: int
+            - What: The id of the origin node from the graph dictionary to start the shortest path tree from
+
+        Optional Arguments:
+
+        - None
+        """
+        Graph.input_check(
+            graph=graph, origin_id=origin_id, destination_id=origin_id
+        )
+        distance_matrix = [float("inf")] * len(graph)
+        predecessor = [None] * len(graph)
+
+        distance_matrix[origin_id] = 0
+        open_leaves = [(0, origin_id)]
+
+        while len(open_leaves) > 0:
+            current_distance, current_id = heappop(open_leaves)
+            if current_distance > distance_matrix[current_id]:
+                continue
+            for connected_id, connected_distance in graph[current_id].items():
+                possible_distance = current_distance + connected_distance
+                if possible_distance < distance_matrix[connected_id]:
+                    distance_matrix[connected_id] = possible_distance
+                    predecessor[connected_id] = current_id
+                    heappush(open_leaves, (possible_distance, connected_id))
+
+        return {
+            "origin_id": origin_id,
+            "predecessor": predecessor,
+            "distance_matrix": distance_matrix,
+        }
+
+    @staticmethod
+    def dijkstra_many(
+        graph: list[dict], origin_ids: list[int], destination_ids: list[int]
+    ) -> list[dict]:
+        """
+        Function:
+
+        - Identify the shortest paths for many origin / destination pairs in a sparse network graph
+            - Pairs are grouped by origin so that each unique origin is only searched once
+            - Each search stops as soon as all of the destinations for that origin have been reached
+            - This is much faster than calling `Graph.dijkstra_makowski` for each pair when origins are repeated
+        - Return a list of dictionaries (one for each origin / destination pair in the order passed) including:
+            - `path`: A list of node ids in the order they are visited
+            - `length`: The length of the path
+
+        Required Arguments:
+
+        - `graph`:
+            - Type: list of dictionaries
+            - See: https://connor-makowski.github.io/scgraph/scgraph/core.html#GeoGraph
+        - `origin_ids`
+            - Type: list of ints
+            - What: The ids of the origin nodes for each pair
+        - `destination_ids`
+            - Type: list of ints
+            - What: The ids of the destination nodes for each pair
+            - Note: This must be the same length as `origin_ids`
+
+        Optional Arguments:
+
+        - None
+        """
+        assert len(origin_ids) == len(
+            destination_ids
+        ), "Origin ids and destination ids must be the same length"
+        # Map each origin to the indices of the pairs that start at it
+        origin_pairs = {}
+        for pair_idx, (origin_id, destination_id) in enumerate(
+            zip(origin_ids, destination_ids)
+        ):
+            Graph.input_check(
+                graph=graph, origin_id=origin_id, destination_id=destination_id
+            )
+            origin_pairs.setdefault(origin_id, []).append(pair_idx)
+
+        output = [None] * len(origin_ids)
+        for origin_id, pair_idxs in origin_pairs.items():
+            open_destinations = {destination_ids[i] for i in pair_idxs}
+            distance_matrix = [float("inf")] * len(graph)
+            predecessor = [None] * len(graph)
+
+            distance_matrix[origin_id] = 0
+            open_leaves = [(0, origin_id)]
+
+            while len(open_destinations) > 0:
+                if len(open_leaves) == 0:
+                    raise Exception(
+                        "Something went wrong, the origin and destination nodes are not connected."
+                    )
+                current_distance, current_id = heappop(open_leaves)
+                if current_distance > distance_matrix[current_id]:
+                    continue
+                open_destinations.discard(current_id)
+                for connected_id, connected_distance in graph[
+                    current_id
+                ].items():
+                    possible_distance = current_distance + connected_distance
+                    if possible_distance < distance_matrix[connected_id]:
+                        distance_matrix[connected_id] = possible_distance
+                        predecessor[connected_id] = current_id
+                        heappush(open_leaves, (possible_distance, connected_id))
+
+            for pair_idx in pair_idxs:
+                current_id = destination_ids[pair_idx]
+                output_path = [current_id]
+                while predecessor[current_id] is not None:
+                    current_id = predecessor[current_id]
+                    output_path.append(current_id)
+                output_path.reverse()
+                output[pair_idx] = {
+                    "path": output_path,
+                    "length": hard_round(
+                        4, distance_matrix[destination_ids[pair_idx]]
+                    ),
+                }
+        return output
+
+    @staticmethod
+    def dijkstra_reach(
+        graph: list[dict],
+        origin_id: int,
+        destination_ids: set[int],
+        forbidden_ids: [set[int], None] = None,
+    ) -> [dict, None]:
         """
         Function:
 
-        - Identify the shortest path between two nodes in a sparse network graph using Makowski's modified Dijkstra algorithm
-            - Modifications allow for a sparse distance matrix to be used instead of a dense distance matrix
-            - Improvements include only computing future potential nodes based on the open leaves for each branch
-                - Open leaves are nodes that have not been visited yet but are adjacent to other visited nodes
-            - This can dramatically reduce the memory and compute requirements of the algorithm
-            - For particularly sparse graphs, this algorithm runs close to O(n log n) time
-                - Where n is the number of nodes in the graph
-            - For dense graphs, this algorithm runs closer to O(n^2) time (similar to the standard Dijkstra algorithm)
-                - Where n is the number of nodes in the graph
-        - Return a dictionary of various path information including:
-            - `id_path`: A list of node ids in the order they are visited
-            - `path`: A list of node dictionaries (lat + long) in the order they are visited
+        - Identify the closest reachable node out of a set of destination nodes in a sparse network graph
+            - The search stops as soon as any destination node is reached
+            - Nodes in `forbidden_ids` are never entered
+            - This is useful for reachability checks where only a yes / no answer (or the closest destination) is needed
+        - Return None if no destination node can be reached
+        - Otherwise, return a dictionary of various path information including:
+            - `destination_id`: The id of the closest reachable destination node
+            - `path`: A list of node ids in the order they are visited
+            - `length`: The length of the path
 
         Required Arguments:
 
@@ -245,42 +923,48 @@ class Graph:
             - See: https://connor-makowski.github.io/scgraph/scgraph/core.html#GeoGraph
         - `origin_id`
             - Type: int
-            - What: The id of the origin node from the graph dictionary to start the shortest path from
-        - `destination_id`
-            - Type: int
-            - What: The id of the destination node from the graph dictionary to end the shortest path at
+            - What: The id of the origin node from the graph dictionary to start the search from
+        - `destination_ids`
+            - Type: set of ints
+            - What: The ids of the destination nodes that end the search when any of them are reached
 
         Optional Arguments:
 
-        - None
+        - `forbidden_ids`
+            - Type: set of ints
+            - What: The ids of nodes that can not be used in the path
+            - Default: None (no nodes are forbidden)
+            - Note: If the origin node is forbidden, it is still used as the start of the search
         """
         Graph.input_check(
-            graph=graph, origin_id=origin_id, destination_id=destination_id
+            graph=graph, origin_id=origin_id, destination_id=origin_id
         )
-        distance_matrix = [float("inf") for i in graph]
-        open_leaves = {}
-        predecessor = [None for i in graph]
+        if forbidden_ids is None:
+            forbidden_ids = set()
+        distance_matrix = [float("inf")] * len(graph)
+        predecessor = [None] * len(graph)
 
         distance_matrix[origin_id] = 0
-        open_leaves[origin_id] = 0
+        open_leaves = [(0, origin_id)]
 
         while True:
             if len(open_leaves) == 0:
-                raise Exception(
-                    "Something went wrong, the origin and destination nodes are not connected."
-                )
-            current_id = min(open_leaves, key=open_leaves.get)
-            open_leaves.pop(current_id)
-            if current_id == destination_id:
+                return None
+            current_distance, current_id = heappop(open_leaves)
+            if current_distance > distance_matrix[current_id]:
+                continue
+            if current_id in destination_ids:
                 break
-            current_distance = distance_matrix[current_id]
             for connected_id, connected_distance in graph[current_id].items():
+                if connected_id in forbidden_ids:
+                    continue
                 possible_distance = current_distance + connected_distance
                 if possible_distance < distance_matrix[connected_id]:
                     distance_matrix[connected_id] = possible_distance
                     predecessor[connected_id] = current_id
-                    open_leaves[connected_id] = possible_distance
+                    heappush(open_leaves, (possible_distance, connected_id))
 
+        destination_id = current_id
         output_path = [current_id]
         while predecessor[current_id] is not None:
             current_id = predecessor[current_id]
@@ -289,14 +973,47 @@ class Graph:
         output_path.reverse()
 
         return {
+            "destination_id": destination_id,
             "path": output_path,
             "length": hard_round(4, distance_matrix[destination_id]),
         }
 
+    @staticmethod
+    def to_csr(graph: list[dict]) -> dict:
+        """
+        Function:
+
+        - Convert a graph into compressed sparse row (CSR) arrays
+            - This is useful for passing a graph to compiled or vectorized tools (EG: `scipy.sparse.csr_matrix((weights, indices, indptr))`)
+            - The arcs from node `i` are stored at positions `indptr[i]` to `indptr[i+1]` in `indices` and `weights`
+        - Return a dictionary including:
+            - `indptr`: A list of length `len(graph)+1` with the starting position of each node's arcs
+            - `indices`: A list of the destination node ids of each arc
+            - `weights`: A list of the distances of each arc
+
+        Required Arguments:
+
+        - `graph`:
+            - Type: list of dictionaries
+            - See: https://connor-makowski.github.io/scgraph/scgraph/core.html#GeoGraph
+
+        Optional Arguments:
+
+        - None
+        """
+        indptr = [0] * (len(graph) + 1)
+        indices = []
+        weights = []
+        for origin_id, destinations in enumerate(graph):
+            indices.extend(destinations.keys())
+            weights.extend(destinations.values())
+            indptr[origin_id + 1] = len(indices)
+        return {"indptr": indptr, "indices": indices, "weights": weights}
+
 
 class GeoGraph:
     def __init__(
-        self, graph: list[dict], nodes: list[list[float|int]]
+        self, graph: list[dict], nodes: list[list[float | int]]
     ) -> None:
         """
         Function:
@@ -309,7 +1026,7 @@ class GeoGraph:
             - Type: list of dictionaries
             - What: A list of dictionaries where the indicies are origin node ids and the values are dictionaries of destination node indices and distances
             - Note: All nodes must be included as origins in the graph regardless of if they have any connected destinations
-            - EG: 
+            - EG:
             ```
                 [
                     # From London
@@ -320,9 +1037,9 @@ class GeoGraph:
                     # From Paris
                     {
                         # To London
-                        0: 311, 
+                        0: 311,
                         # To Berlin
-                        2: 878, 
+                        2: 878,
                         # To Rome
                         3: 1439,
                         # To Madrid
@@ -330,7 +1047,7 @@ class GeoGraph:
                     },
                     # From Berlin
                     {
-                        # To Paris 
+                        # To Paris
                         1: 878,
                         # To Rome
                         3: 1181,
@@ -360,7 +1077,7 @@ class GeoGraph:
             - Type: list of lists of ints or floats
             - What: A list of lists where the values are coordinates (latitude then longitude)
             - Note: The length of the nodes list must be the same as that of the graph list
-            - EG: 
+            - EG:
             ```
                 [
                     # London
@@ -380,6 +1097,12 @@ class GeoGraph:
         """
         self.graph = graph
         self.nodes = nodes
+        self.landmark_distances = []
+        self.landmark_bounds = None
+        self.shortest_path_cache = OrderedDict()
+        self.contraction_hierarchy = None
+        self.lat_sorted_ids = []
+        self.lat_sorted_lats = []
 
     def validate_graph(
         self, check_symmetry: bool = True, check_connected: bool = True
@@ -432,42 +1155,37 @@ class GeoGraph:
         - None
         """
         assert isinstance(self.nodes, list), "Your nodes must be a dictionary"
-        assert all(
-            [isinstance(i, list) for i in self.nodes]
-        ), "Your nodes must be a list of lists"
-        assert all(
-            [len(i) == 2 for i in self.nodes]
-        ), "Your nodes must be a list of lists where each sub list has a length of 2"
-        assert all(
-            [
-                (
-                    isinstance(i[0], (int, float))
-                    and isinstance(i[1], (int, float))
-                )
-                for i in self.nodes
-            ]
-        ), "Your nodes must be a list of lists where each sub list has a numeric latitude and longitude value"
-        assert all(
-            [
-                (i[0] >= -90 and i[0] <= 90 and i[1] >= -180 and i[1] <= 180)
-                for i in self.nodes
-            ]
-        ), "Your nodes must be a list of lists where each sub list has a length of 2 with a latitude [-90,90] and longitude [-180,180] value"
+        # Validate each node in a single pass over self.nodes
+        for node in self.nodes:
+            assert isinstance(node, list), "Your nodes must be a list of lists"
+            assert (
+                len(node) == 2
+            ), "Your nodes must be a list of lists where each sub list has a length of 2"
+            lat, lon = node
+            assert isinstance(lat, (int, float)) and isinstance(
+                lon, (int, float)
+            ), "Your nodes must be a list of lists where each sub list has a numeric latitude and longitude value"
+            assert (
+                -90 <= lat <= 90 and -180 <= lon <= 180
+            ), "Your nodes must be a list of lists where each sub list has a length of 2 with a latitude [-90,90] and longitude [-180,180] value"
 
     def get_shortest_path(
         self,
-        origin_node: dict[float|int],
-        destination_node: dict[float|int],
+        origin_node: dict[float | int],
+        destination_node: dict[float | int],
         output_units: str = "km",
         algorithm_fn=Graph.dijkstra_makowski,
-        off_graph_circuity: [float|int] = 1,
+        off_graph_circuity: [float | int] = 1,
         node_addition_type: str = "quadrant",
-        node_addition_circuity: [float|int] = 4,
+        node_addition_circuity: [float | int] = 4,
         geograph_units: str = "km",
         output_coordinate_path: str = "list_of_lists",
         output_path: bool = False,
-        node_addition_lat_lon_bound: [float|int] = 5,
+        node_addition_lat_lon_bound: [float | int] = 5,
         node_addition_math: str = "euclidean",
+        algorithm_kwargs: [dict, None] = None,
+        cache: bool = False,
+        cache_size: int = 4096,
         **kwargs,
     ) -> dict:
         """
@@ -507,6 +1225,9 @@ class GeoGraph:
             - Options:
                 - 'Graph.dijkstra': A modified dijkstra algorithm that uses a sparse distance matrix to identify the shortest path
                 - 'Graph.dijkstra_makowski': A modified dijkstra algorithm that uses a sparse distance matrix to identify the shortest path
+                - 'Graph.dijkstra_bidirectional': A bidirectional dijkstra algorithm that searches from both the origin and destination to identify the shortest path
+                - 'Graph.dijkstra_contraction_hierarchy': A bidirectional dijkstra algorithm over a precomputed contraction hierarchy (see `GeoGraph.precompute_contraction_hierarchy`)
+                - 'Graph.a_star': An A* algorithm that uses a heuristic function (passed in `algorithm_kwargs`) to identify the shortest path
                 - Any user defined algorithm that takes the arguments:
                     - `graph`: A dictionary of dictionaries where the keys are origin node ids and the values are dictionaries of destination node ids and distances
                         - See: https://connor-makowski.github.io/scgraph/scgraph/core.html#GeoGraph
@@ -528,9 +1249,7 @@ class GeoGraph:
                 - 'closest': Add only the closest node to the distance matrix for this node
                 - 'all': Add all nodes to the distance matrix for this node
             - Notes:
-                - `dijkstra_makowski` will operate substantially faster if the `node_addition_type` is set to 'quadrant' or 'closest'
-                - `dijkstra` will operate at the similar speeds regardless of the `node_addition_type`
-                - When using `all`, you should consider using `dijkstra` instead of `dijkstra_makowski` as it will be faster
+                - `dijkstra` and `dijkstra_makowski` will operate substantially faster if the `node_addition_type` is set to 'quadrant' or 'closest'
                 - The destination node is always added as 'all' regardless of the `node_addition_type` setting
                     - This guarantees that any destination node will be connected to any origin node regardless of how or where the origin node is added to the graph
                 - If the passed graph is not a connected graph (meaning it is comprised of multiple disconnected networks)
@@ -582,9 +1301,87 @@ class GeoGraph:
                 - 'haversine': Use the haversine distance between nodes. This is slower but is an accurate representation of the surface distance between two points on the earth
             - Notes:
                 - Only used if `node_addition_type` is set to 'quadrant' or 'closest'
+        - `algorithm_kwargs`
+            - Type: dict
+            - What: Additional keyword arguments to pass to the `algorithm_fn`
+            - Default: None (no additional keyword arguments)
+            - EG: `{"heuristic_fn": my_geograph.landmark_heuristic}` when using `Graph.a_star`
+            - Note: When using `Graph.a_star` without a `heuristic_fn`, the haversine distance to the destination (converted to the `geograph_units`) is used
+                - This only guarantees the shortest path if no arc in the graph is shorter than the haversine distance between its nodes
+                - Arc distances are rounded and can come from user loaded data, so this is not always the case
+        - `cache`
+            - Type: bool
+            - What: Whether to store the output and reuse it for later calls with the same arguments
+            - Default: False
+            - Notes:
+                - Origin and destination coordinates are rounded to 6 decimal places (about 10cm) when matching calls, so repeated queries for the same location reuse the output even with small floating point differences
+                - The cache is cleared by `mod_add_node`, `mod_add_arc` and `mod_remove_arc`
+                - If you modify `self.graph` or `self.nodes` in any other way, call `self.shortest_path_cache.clear()`
+                - The values in `algorithm_kwargs` must be hashable to use the cache
+        - `cache_size`
+            - Type: int
+            - What: The maximum number of outputs to keep in the cache
+            - Default: 4096
+            - Note: Once the cache is full, the least recently used output is removed
         - `**kwargs`
             - Additional keyword arguments. These are included for forwards and backwards compatibility reasons, but are not currently used.
         """
+        # Build a new dict so defaults can be added without changing the caller's dict
+        algorithm_kwargs = (
+            {} if algorithm_kwargs is None else dict(algorithm_kwargs)
+        )
+        if cache:
+            cache_key = (
+                round(origin_node["latitude"], 6),
+                round(origin_node["longitude"], 6),
+                round(destination_node["latitude"], 6),
+                round(destination_node["longitude"], 6),
+                output_units,
+                algorithm_fn,
+                off_graph_circuity,
+                node_addition_type,
+                node_addition_circuity,
+                geograph_units,
+                output_coordinate_path,
+                output_path,
+                node_addition_lat_lon_bound,
+                node_addition_math,
+                tuple(sorted(algorithm_kwargs.items())),
+            )
+            if cache_key in self.shortest_path_cache:
+                # Mark the output as the most recently used
+                self.shortest_path_cache.move_to_end(cache_key)
+                # Copy the output so callers can not modify the cached lists
+                return {
+                    key: value.copy() if isinstance(value, list) else value
+                    for key, value in self.shortest_path_cache[
+                        cache_key
+                    ].items()
+                }
+        if (
+            algorithm_fn == Graph.a_star
+            and "heuristic_fn" not in algorithm_kwargs
+        ):
+            # Default to the great circle distance (in the geograph units) as the heuristic
+            heuristic_scale = distance_converter(
+                1, input_units="km", output_units=geograph_units
+            )
+            algorithm_kwargs["heuristic_fn"] = (
+                lambda origin_id, destination_id: self.haversine(
+                    origin_id, destination_id
+                )
+                * heuristic_scale
+            )
+        if (
+            algorithm_fn == Graph.dijkstra_contraction_hierarchy
+            and "contraction_hierarchy" not in algorithm_kwargs
+        ):
+            assert (
+                self.contraction_hierarchy is not None
+            ), "You must run `precompute_contraction_hierarchy` before using `Graph.dijkstra_contraction_hierarchy`"
+            algorithm_kwargs["contraction_hierarchy"] = (
+                self.contraction_hierarchy
+            )
         original_graph_length = len(self.graph)
         # Add the origin and destination nodes to the graph
         origin_id = self.add_node(
@@ -607,6 +1404,7 @@ class GeoGraph:
                 graph=self.graph,
                 origin_id=origin_id,
                 destination_id=destination_id,
+                **algorithm_kwargs,
             )
             output["coordinate_path"] = self.get_coordinate_path(output["path"])
             output["length"] = self.adujust_circuity_length(
@@ -633,6 +1431,13 @@ class GeoGraph:
                 del output["path"]
             while len(self.graph) > original_graph_length:
                 self.remove_appended_node()
+            if cache:
+                self.shortest_path_cache[cache_key] = {
+                    key: value.copy() if isinstance(value, list) else value
+                    for key, value in output.items()
+                }
+                while len(self.shortest_path_cache) > cache_size:
+                    self.shortest_path_cache.popitem(last=False)
             return output
         except Exception as e:
             while len(self.graph) > original_graph_length:
@@ -642,9 +1447,9 @@ class GeoGraph:
     def adujust_circuity_length(
         self,
         output: dict,
-        node_addition_circuity: [float|int],
-        off_graph_circuity: [float|int],
-    ) -> [float|int]:
+        node_addition_circuity: [float | int],
+        off_graph_circuity: [float | int],
+    ) -> [float | int]:
         """
         Function:
 
@@ -679,7 +1484,299 @@ class GeoGraph:
                 4,
             )
 
-    def get_coordinate_path(self, path: list[int]) -> list[dict[float|int]]:
+    def haversine(self, origin_id: int, destination_id: int) -> float:
+        """
+        Function:
+
+        - Return the haversine distance (km) between two nodes in the graph
+        - This can be used as the `heuristic_fn` for `Graph.a_star`
+            - Note: This is only a valid heuristic if the graph distances are in km and are never shorter than the haversine distance
+
+        Required Arguments:
+
+        - `origin_id`
+            - Type: int
+            - What: The id of the origin node
+        - `destination_id`
+            - Type: int
+            - What: The id of the destination node
+
+        Optional Arguments:
+
+        - None
+        """
+        return haversine(self.nodes[origin_id], self.nodes[destination_id])
+
+    def precompute_landmarks(self, landmark_count: int = 16) -> None:
+        """
+        Function:
+
+        - Precompute the shortest distances from a set of landmark nodes to every node in the graph
+            - Landmarks are chosen by farthest point sampling (each new landmark is the node farthest from all existing landmarks)
+            - These distances are stored in `self.landmark_distances` and are used by `GeoGraph.landmark_heuristic`
+        - Return None
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - `landmark_count`
+            - Type: int
+            - What: The number of landmarks to use
+            - Default: 16
+            - Note: More landmarks produce a tighter heuristic but require more memory and precomputation time
+
+        Notes:
+
+        - Landmark distances assume the graph is symmetric (see `GeoGraph.validate_graph`)
+        - `mod_add_node`, `mod_add_arc` and `mod_remove_arc` clear the landmark distances, so this should be called again after modifying the graph
+        """
+        assert isinstance(
+            landmark_count, int
+        ), "Landmark count must be an integer"
+        assert landmark_count > 0, "Landmark count must be greater than 0"
+        self.landmark_distances = []
+        self.landmark_bounds = None
+        # The distance from each node to its closest landmark
+        landmark_gaps = [float("inf")] * len(self.graph)
+        landmark_id = 0
+        for i in range(min(landmark_count, len(self.graph))):
+            distances = Graph.shortest_path_tree(
+                graph=self.graph, origin_id=landmark_id
+            )["distance_matrix"]
+            self.landmark_distances.append(distances)
+            landmark_gaps = [
+                min(gap, distance)
+                for gap, distance in zip(landmark_gaps, distances)
+            ]
+            # Unreachable nodes have an infinite gap so other components are covered next
+            landmark_id = max(
+                range(len(landmark_gaps)), key=landmark_gaps.__getitem__
+            )
+            if landmark_gaps[landmark_id] == 0:
+                break
+
+    def precompute_contraction_hierarchy(
+        self, witness_settle_limit: int = 50
+    ) -> None:
+        """
+        Function:
+
+        - Precompute a contraction hierarchy (see `Graph.contraction_hierarchy`) for the graph
+            - This is stored in `self.contraction_hierarchy` and is used when `get_shortest_path` is called with `algorithm_fn=Graph.dijkstra_contraction_hierarchy`
+        - Return None
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - `witness_settle_limit`
+            - Type: int
+            - What: The maximum number of nodes to settle in each witness search
+            - Default: 50
+
+        Notes:
+
+        - The contraction hierarchy assumes the graph is symmetric (see `GeoGraph.validate_graph`)
+        - `mod_add_node`, `mod_add_arc` and `mod_remove_arc` clear the contraction hierarchy, so this should be called again after modifying the graph
+        """
+        assert (
+            isinstance(witness_settle_limit, int) and witness_settle_limit > 0
+        ), "Witness settle limit must be a positive integer"
+        self.contraction_hierarchy = Graph.contraction_hierarchy(
+            graph=self.graph, witness_settle_limit=witness_settle_limit
+        )
+
+    def get_landmark_bounds(self, destination_id: int) -> dict:
+        """
+        Function:
+
+        - Return the landmark bounds used by `GeoGraph.landmark_heuristic` to estimate the distance to a destination node
+            - Nodes added after `GeoGraph.precompute_landmarks` was called (appended nodes) have no landmark distances
+                - EG: The origin and destination nodes that are added by `GeoGraph.get_shortest_path`
+            - Appended nodes are bounded through their arcs to precomputed nodes
+                - A path that enters an appended node from a precomputed node `n` over an arc of length `w` has a length of at least `d(landmark, n) + w - d(landmark, origin)` and `d(landmark, origin) - d(landmark, n) + w`
+            - Any path to the destination first reaches either the destination or an appended node, so each of these is stored as a target
+        - Bounds are cached in `self.landmark_bounds` and are only recomputed when the destination or the appended nodes change
+        - Return a dictionary including:
+            - `destination_id`: The id of the destination node
+            - `appended_arcs`: The arc dictionaries of the appended nodes that the bounds were computed from
+            - `targets`: A list of `[node_id, remaining_bound, plus_distances, minus_distances]` for the destination and each appended node
+                - `remaining_bound`: A lower bound on the distance from `node_id` to the destination
+                - `plus_distances`: The smallest `d(landmark, n) + w` over the arcs of `node_id` for each landmark
+                - `minus_distances`: The largest `d(landmark, n) - w` over the arcs of `node_id` for each landmark
+
+        Required Arguments:
+
+        - `destination_id`
+            - Type: int
+            - What: The id of the destination node
+
+        Optional Arguments:
+
+        - None
+        """
+        landmark_node_count = len(self.landmark_distances[0])
+        appended_arcs = self.graph[landmark_node_count:]
+        bounds = self.landmark_bounds
+        if (
+            bounds is not None
+            and bounds["destination_id"] == destination_id
+            and len(bounds["appended_arcs"]) == len(appended_arcs)
+            and all(
+                cached_arcs is arcs
+                for cached_arcs, arcs in zip(
+                    bounds["appended_arcs"], appended_arcs
+                )
+            )
+        ):
+            return bounds
+        targets = []
+        if destination_id < landmark_node_count:
+            # A precomputed destination is bounded by its own landmark distances
+            destination_distances = [
+                distances[destination_id]
+                for distances in self.landmark_distances
+            ]
+            targets.append(
+                [
+                    destination_id,
+                    0,
+                    destination_distances,
+                    destination_distances,
+                ]
+            )
+        for node_id in range(landmark_node_count, len(self.graph)):
+            plus_distances = []
+            minus_distances = []
+            for distances in self.landmark_distances:
+                plus_distance = float("inf")
+                minus_distance = float("-inf")
+                for connected_id, connected_distance in self.graph[
+                    node_id
+                ].items():
+                    if connected_id < landmark_node_count:
+                        plus_distance = min(
+                            plus_distance,
+                            distances[connected_id] + connected_distance,
+                        )
+                        minus_distance = max(
+                            minus_distance,
+                            distances[connected_id] - connected_distance,
+                        )
+                plus_distances.append(plus_distance)
+                minus_distances.append(minus_distance)
+            targets.append([node_id, 0, plus_distances, minus_distances])
+        # With a single appended node besides the destination (EG: the origin added by `get_shortest_path`)
+        # a path from it reaches the destination directly or through a precomputed node
+        # Otherwise, paths can pass through other appended nodes so the remaining bound stays 0
+        other_targets = [
+            target for target in targets if target[0] != destination_id
+        ]
+        if len(other_targets) == 1:
+            destination_target = [
+                target for target in targets if target[0] == destination_id
+            ]
+            remaining_bound = float("inf")
+            for connected_id, connected_distance in self.graph[
+                other_targets[0][0]
+            ].items():
+                if connected_id < landmark_node_count:
+                    connected_distance += self.get_landmark_bound(
+                        origin_id=connected_id, targets=destination_target
+                    )
+                remaining_bound = min(remaining_bound, connected_distance)
+            if remaining_bound != float("inf"):
+                other_targets[0][1] = remaining_bound
+        self.landmark_bounds = {
+            "destination_id": destination_id,
+            "appended_arcs": appended_arcs,
+            "targets": targets,
+        }
+        return self.landmark_bounds
+
+    def get_landmark_bound(self, origin_id: int, targets: list) -> float:
+        """
+        Function:
+
+        - Return a lower bound on the graph distance from a precomputed node to the destination of a set of landmark targets (see `GeoGraph.get_landmark_bounds`)
+            - For each target, the bound is the largest landmark bound between the origin and that target plus the target's remaining bound
+            - The smallest of these is returned as any path to the destination first reaches one of the targets
+
+        Required Arguments:
+
+        - `origin_id`
+            - Type: int
+            - What: The id of the origin node
+            - Note: This must be a node that was included when `GeoGraph.precompute_landmarks` was called
+        - `targets`
+            - Type: list
+            - What: The `targets` from `GeoGraph.get_landmark_bounds`
+
+        Optional Arguments:
+
+        - None
+        """
+        origin_distances = [
+            distances[origin_id] for distances in self.landmark_distances
+        ]
+        heuristic = float("inf")
+        for target in targets:
+            bound = 0
+            for origin_distance, plus_distance, minus_distance in zip(
+                origin_distances, target[2], target[3]
+            ):
+                difference = max(
+                    plus_distance - origin_distance,
+                    origin_distance - minus_distance,
+                )
+                # Skip landmarks that can not reach one (inf) or both (nan) nodes
+                if difference > bound and difference != float("inf"):
+                    bound = difference
+            heuristic = min(heuristic, bound + target[1])
+        return heuristic
+
+    def landmark_heuristic(self, origin_id: int, destination_id: int) -> float:
+        """
+        Function:
+
+        - Return a lower bound on the graph distance between two nodes using precomputed landmarks (ALT)
+            - The bound is the largest difference between the landmark distances of the two nodes for any landmark
+            - This can be used as the `heuristic_fn` for `Graph.a_star`
+        - Nodes added after `GeoGraph.precompute_landmarks` was called are bounded through their arcs to precomputed nodes (see `GeoGraph.get_landmark_bounds`)
+            - EG: The origin and destination nodes that are added by `GeoGraph.get_shortest_path`
+
+        Required Arguments:
+
+        - `origin_id`
+            - Type: int
+            - What: The id of the origin node
+        - `destination_id`
+            - Type: int
+            - What: The id of the destination node
+
+        Optional Arguments:
+
+        - None
+        """
+        assert (
+            len(self.landmark_distances) > 0
+        ), "Landmarks must be precomputed with `precompute_landmarks` before using `landmark_heuristic`"
+        if origin_id == destination_id:
+            return 0
+        targets = self.get_landmark_bounds(destination_id)["targets"]
+        if origin_id >= len(self.landmark_distances[0]):
+            # Appended origins use their stored remaining bound
+            for target in targets:
+                if target[0] == origin_id:
+                    return target[1]
+        return self.get_landmark_bound(origin_id=origin_id, targets=targets)
+
+    def get_coordinate_path(self, path: list[int]) -> list[dict[float | int]]:
         """
         Function:
 
@@ -715,19 +1812,58 @@ class GeoGraph:
         - None
         """
         node_id = len(self.graph) - 1
-        for reverse_connection in [i for i in self.graph[node_id].keys()]:
+        # Iterate over a snapshot as a self loop would delete from this same dict
+        for reverse_connection in tuple(self.graph[node_id]):
             del self.graph[reverse_connection][node_id]
-        self.graph = self.graph[:node_id]
-        self.nodes = self.nodes[:node_id]
+        self.graph.pop()
+        self.nodes.pop()
+        if node_id < len(self.lat_sorted_ids):
+            self.lat_sorted_ids = []
+            self.lat_sorted_lats = []
+
+    def update_lat_sorted_index(self) -> None:
+        """
+        Function:
+
+        - Update the latitude sorted node index used by `get_node_distances` to find nodes within a bounding box
+        - The index is rebuilt if nodes that it covers were removed or if more than 10% of the nodes were appended after it was built
+            - Otherwise, appended nodes are scanned individually by `get_node_distances`
+        - Return None
+
+        Required Arguments:
+
+        - None
+
+        Optional Arguments:
+
+        - None
+
+        Notes:
+
+        - If you modify `self.nodes` other than through the GeoGraph methods, set `self.lat_sorted_ids` to an empty list to force a rebuild
+        """
+        indexed_count = len(self.lat_sorted_ids)
+        node_count = len(self.nodes)
+        if (
+            indexed_count > node_count
+            or (node_count - indexed_count) * 10 > node_count
+        ):
+            nodes = self.nodes
+            self.lat_sorted_ids = sorted(
+                range(node_count), key=lambda node_idx: nodes[node_idx][0]
+            )
+            self.lat_sorted_lats = [
+                nodes[node_idx][0] for node_idx in self.lat_sorted_ids
+            ]
 
     def get_node_distances(
         self,
         node: list,
-        circuity: [float|int],
+        circuity: [float | int],
         node_addition_type: str,
         node_addition_math: str,
-        lat_lon_bound: [float|int],
-    ) -> dict[float|int]:
+        lat_lon_bound: [float | int],
+    ) -> dict[float | int]:
         """
         Function:
 
@@ -752,9 +1888,7 @@ class GeoGraph:
                 - 'closest': Add only the closest node to the distance matrix for this node
                 - 'all': Add all nodes to the distance matrix for this node
             - Notes:
-                - `dijkstra_makowski` will operate substantially faster if the `node_addition_type` is set to 'quadrant' or 'closest'
-                - `dijkstra` will operate at the similar speeds regardless of the `node_addition_type`
-                - When using `all`, you should consider using `dijkstra` instead of `dijkstra_makowski` as it will be faster
+                - `dijkstra` and `dijkstra_makowski` will operate substantially faster if the `node_addition_type` is set to 'quadrant' or 'closest'
         - `node_addition_math`
             - Type: str
             - What: The math to use when calculating the distance between nodes when determining the closest node (or closest quadrant node) to add to the graph
@@ -767,6 +1901,7 @@ class GeoGraph:
         - `lat_lon_bound`
             - Type: int | float
             - What: Forms a bounding box around the node that is to be added to graph. Only selects graph nodes to consider joining that are within this bounding box.
+            - Note: A `lat_lon_bound` of 180 or more considers every node in the graph
         """
         assert node_addition_type in [
             "quadrant",
@@ -778,60 +1913,110 @@ class GeoGraph:
             "haversine",
         ], f"Invalid node addition math provided ({node_addition_math}), valid options are: ['euclidean', 'haversine']"
         # Get only bounded nodes
-        nodes = {
-            node_idx: node_i
-            for node_idx, node_i in enumerate(self.nodes)
-            if abs(node_i[0] - node[0]) < lat_lon_bound
-            and abs(node_i[1] - node[1]) < lat_lon_bound
-        }
-        if len(nodes) == 0:
+        # Bounds are computed once so each node only needs chained comparisons
+        lat_min = node[0] - lat_lon_bound
+        lat_max = node[0] + lat_lon_bound
+        lon_min = node[1] - lat_lon_bound
+        lon_max = node[1] + lat_lon_bound
+        all_nodes = self.nodes
+        if lat_lon_bound >= 180:
+            # Every node is within 180 degrees of latitude and longitude (wrapping at the antimeridian)
+            # The box would not wrap, so skip filtering and use all nodes
+            bounded_ids = range(len(all_nodes))
+        else:
+            # Only scan the latitude band of the sorted index and any unindexed nodes
+            self.update_lat_sorted_index()
+            band_start = bisect_right(self.lat_sorted_lats, lat_min)
+            band_end = bisect_left(self.lat_sorted_lats, lat_max)
+            if band_end - band_start == len(self.lat_sorted_ids):
+                candidate_ids = range(len(all_nodes))
+            else:
+                candidate_ids = self.lat_sorted_ids[band_start:band_end]
+                candidate_ids.extend(
+                    range(len(self.lat_sorted_ids), len(all_nodes))
+                )
+            bounded_ids = [
+                node_idx
+                for node_idx in candidate_ids
+                if lat_min < all_nodes[node_idx][0] < lat_max
+                and lon_min < all_nodes[node_idx][1] < lon_max
+            ]
+            # Keep node id order so ties resolve the same way as a full scan
+            if not isinstance(candidate_ids, range):
+                bounded_ids.sort()
+        if len(bounded_ids) == 0:
             # Default to all if the lat_lon_bound fails to find any nodes
-            return self.get_node_distances(
-                node=node,
-                circuity=circuity,
-                lat_lon_bound=180,
-                node_addition_type=node_addition_type,
-                node_addition_math=node_addition_math,
-            )
+            # All nodes are used directly instead of filtering them again
+            bounded_ids = range(len(all_nodes))
+        if isinstance(bounded_ids, range):
+            bounded_nodes = all_nodes
+        else:
+            bounded_nodes = [all_nodes[node_idx] for node_idx in bounded_ids]
         if node_addition_type == "all":
             return {
-                node_idx: round(haversine(node, node_i, circuity=circuity), 4)
-                for node_idx, node_i in nodes.items()
+                node_idx: round(distance, 4)
+                for node_idx, distance in zip(
+                    bounded_ids,
+                    haversine_many(node, bounded_nodes, circuity=circuity),
+                )
             }
+        # Compute all candidate distances in one pass instead of a function call per node
+        # These are only compared, so they are not rounded
         if node_addition_math == "haversine":
-            dist_fn = lambda x: round(haversine(node, x, circuity=circuity), 4)
+            distances = haversine_many(node, bounded_nodes, circuity=circuity)
         else:
-            dist_fn = lambda x: round(
-                ((node[0] - x[0]) ** 2 + (node[1] - x[1]) ** 2) ** 0.5, 4
-            )
+            # Squared euclidean distances keep the same order without a square root
+            node_lat, node_lon = node
+            distances = [
+                (node_lat - lat) ** 2 + (node_lon - lon) ** 2
+                for lat, lon in bounded_nodes
+            ]
         if node_addition_type == "closest":
-            quadrant_fn = lambda x, y: "all"
+            # Let the builtin min scan the candidates (ties go to the lowest node id)
+            closest_distance, closest_idx = min(zip(distances, bounded_ids))
+            closest_idxs = [closest_idx]
+            closest_distances = [closest_distance]
         else:
-            quadrant_fn = lambda x, y: ("n" if x[0] - y[0] > 0 else "s") + (
-                "e" if x[1] - y[1] > 0 else "w"
+            # Quadrants are encoded as 2 * north + east to index flat lists
+            node_lat, node_lon = node
+            min_diffs = [float("inf")] * 4
+            min_diffs_idx = [None] * 4
+            quadrant_order = []
+            # Unpack coordinates in the loop target instead of indexing each node
+            for node_idx, (lat, lon), dist in zip(
+                bounded_ids, bounded_nodes, distances
+            ):
+                quadrant = 2 * (lat > node_lat) + (lon > node_lon)
+                if dist < min_diffs[quadrant]:
+                    if min_diffs_idx[quadrant] is None:
+                        quadrant_order.append(quadrant)
+                    min_diffs[quadrant] = dist
+                    min_diffs_idx[quadrant] = node_idx
+            closest_idxs = [
+                min_diffs_idx[quadrant] for quadrant in quadrant_order
+            ]
+            closest_distances = [
+                min_diffs[quadrant] for quadrant in quadrant_order
+            ]
+        # Haversine candidate distances already are the final distances
+        if node_addition_math == "euclidean":
+            closest_distances = haversine_many(
+                node,
+                [self.nodes[node_idx] for node_idx in closest_idxs],
+                circuity=circuity,
             )
-        min_diffs = {}
-        min_diffs_idx = {}
-        for node_idx, node_i in nodes.items():
-            quadrant = quadrant_fn(node_i, node)
-            dist = dist_fn(node_i)
-            if dist < min_diffs.get(quadrant, 999999999):
-                min_diffs[quadrant] = dist
-                min_diffs_idx[quadrant] = node_idx
         return {
-            node_idx: round(
-                haversine(node, self.nodes[node_idx], circuity=circuity), 4
-            )
-            for node_idx in min_diffs_idx.values()
+            node_idx: round(distance, 4)
+            for node_idx, distance in zip(closest_idxs, closest_distances)
         }
 
     def add_node(
         self,
-        node: dict[float|int],
-        circuity: [float|int],
+        node: dict[float | int],
+        circuity: [float | int],
         node_addition_type: str = "quadrant",
         node_addition_math: str = "euclidean",
-        lat_lon_bound: [float|int] = 5,
+        lat_lon_bound: [float | int] = 5,
     ) -> int:
         """
         Function:
@@ -861,9 +2046,7 @@ class GeoGraph:
                 - 'closest': Add only the closest node to the distance matrix for this node
                 - 'all': Add all nodes to the distance matrix for this node
             - Notes:
-                - `dijkstra_makowski` will operate substantially faster if the `node_addition_type` is set to 'quadrant' or 'closest'
-                - `dijkstra` will operate at the similar speeds regardless of the `node_addition_type`
-                - When using `all`, you should consider using `dijkstra` instead of `dijkstra_makowski` as it will be faster
+                - `dijkstra` and `dijkstra_makowski` will operate substantially faster if the `node_addition_type` is set to 'quadrant' or 'closest'
         - `node_addition_math`
             - Type: str
             - What: The math to use when calculating the distance between nodes when determining the closest node (or closest quadrant node) to add to the graph
@@ -914,11 +2097,12 @@ class GeoGraph:
         )
 
         # Create the node
-        new_node_id = len(self.graph)
+        graph = self.graph
+        new_node_id = len(graph)
         self.nodes.append(node)
-        self.graph.append(distances)
+        graph.append(distances)
         for node_idx, node_distance in distances.items():
-            self.graph[node_idx][new_node_id] = node_distance
+            graph[node_idx][new_node_id] = node_distance
         return new_node_id
 
     def save_as_geojson(self, filename: str) -> None:
@@ -936,38 +2120,41 @@ class GeoGraph:
             - What: The filename to save the geojson file as
 
         """
-        features = []
-        for origin_idx, destinations in enumerate(self.graph):
-            for destination_idx, distance in destinations.items():
-                # Create an undirected graph for geojson purposes
-                if origin_idx > destination_idx:
-                    continue
-                origin = self.nodes[origin_idx]
-                destination = self.nodes[destination_idx]
-                features.append(
-                    {
-                        "type": "Feature",
-                        "properties": {
-                            "origin_idx": origin_idx,
-                            "destination_idx": destination_idx,
-                            "distance": distance,
-                        },
-                        "geometry": {
-                            "type": "LineString",
-                            "coordinates": [
-                                [origin[1], origin[0]],
-                                [
-                                    destination[1],
-                                    destination[0],
-                                ],
-                            ],
-                        },
-                    }
-                )
-
-        out_dict = {"type": "FeatureCollection", "features": features}
+        nodes = self.nodes
+        # Stream one feature at a time so the full collection is never held in memory
+        # Separators match json.dumps defaults so the output is unchanged
         with open(filename, "w") as f:
-            json.dump(out_dict, f)
+            f.write('{"type": "FeatureCollection", "features": [')
+            separator = ""
+            for origin_idx, destinations in enumerate(self.graph):
+                origin = nodes[origin_idx]
+                for destination_idx, distance in destinations.items():
+                    # Create an undirected graph for geojson purposes
+                    if origin_idx > destination_idx:
+                        continue
+                    destination = nodes[destination_idx]
+                    f.write(separator)
+                    f.write(
+                        json.dumps(
+                            {
+                                "type": "Feature",
+                                "properties": {
+                                    "origin_idx": origin_idx,
+                                    "destination_idx": destination_idx,
+                                    "distance": distance,
+                                },
+                                "geometry": {
+                                    "type": "LineString",
+                                    "coordinates": [
+                                        [origin[1], origin[0]],
+                                        [destination[1], destination[0]],
+                                    ],
+                                },
+                            }
+                        )
+                    )
+                    separator = ", "
+            f.write("]}")
 
     def save_as_geograph(self, name: str) -> None:
         """
@@ -987,9 +2174,19 @@ class GeoGraph:
         """
         self.validate_nodes()
         self.validate_graph(check_symmetry=True, check_connected=False)
-        out_string = f"""from scgraph.core import GeoGraph\ngraph={str(self.graph)}\nnodes={str(self.nodes)}\n{name}_geograph = GeoGraph(graph=graph, nodes=nodes)"""
+        # Write row by row to avoid holding full string copies of large graphs in memory
         with open(name + ".py", "w") as f:
-            f.write(out_string)
+            for prefix, rows in [
+                ("from scgraph.core import GeoGraph\ngraph=[", self.graph),
+                ("]\nnodes=[", self.nodes),
+            ]:
+                f.write(prefix)
+                separator = ""
+                for row in rows:
+                    f.write(separator)
+                    f.write(repr(row))
+                    separator = ", "
+            f.write(f"]\n{name}_geograph = GeoGraph(graph=graph, nodes=nodes)")
 
     def mod_remove_arc(
         self, origin_idx: int, destination_idx: int, undirected: bool = True
@@ -1020,13 +2217,17 @@ class GeoGraph:
             self.graph
         ), "Destination node does not exist"
         assert destination_idx in self.graph[origin_idx], "Arc does not exist"
+        self.shortest_path_cache = OrderedDict()
+        self.contraction_hierarchy = None
+        self.landmark_distances = []
+        self.landmark_bounds = None
         del self.graph[origin_idx][destination_idx]
         if undirected:
             if origin_idx in self.graph[destination_idx]:
                 del self.graph[destination_idx][origin_idx]
 
     def mod_add_node(
-        self, latitude: [float|int], longitude: [float|int]
+        self, latitude: [float | int], longitude: [float | int]
     ) -> int:
         """
         Function:
@@ -1046,6 +2247,10 @@ class GeoGraph:
 
         - The index of the new node
         """
+        self.shortest_path_cache = OrderedDict()
+        self.contraction_hierarchy = None
+        self.landmark_distances = []
+        self.landmark_bounds = None
         self.nodes.append([latitude, longitude])
         self.graph.append({})
         return len(self.graph) - 1
@@ -1054,7 +2259,7 @@ class GeoGraph:
         self,
         origin_idx: int,
         destination_idx: int,
-        distance: [float|int] = 0,
+        distance: [float | int] = 0,
         use_haversine_distance=True,
         undirected: bool = True,
     ) -> None:
@@ -1092,6 +2297,10 @@ class GeoGraph:
         assert destination_idx < len(
             self.graph
         ), "Destination node does not exist"
+        self.shortest_path_cache = OrderedDict()
+        self.contraction_hierarchy = None
+        self.landmark_distances = []
+        self.landmark_bounds = None
         if use_haversine_distance:
             distance = haversine(
                 self.nodes[origin_idx], self.nodes[destination_idx]
@@ -1202,17 +2411,20 @@ def load_geojson_as_geograph(geojson_filename: str) -> GeoGraph:
         # Update the data
         nodes_dict[origin_idx] = origin
         nodes_dict[destination_idx] = destination
-        graph_dict[origin_idx] = {
-            **graph_dict.get(origin_idx, {}),
-            destination_idx: distance,
-        }
-        graph_dict[destination_idx] = {
-            **graph_dict.get(destination_idx, {}),
-            origin_idx: distance,
-        }
+        # Update the arc dictionaries in place rather than copying them per arc
+        graph_dict.setdefault(origin_idx, {})[destination_idx] = distance
+        graph_dict.setdefault(destination_idx, {})[origin_idx] = distance
     assert len(nodes_dict) == len(
         graph_dict
     ), "All nodes must be included as origins in the graph dictionary"
+    if set(graph_dict) == set(range(len(graph_dict))):
+        # Node idxs are already exactly 0 to n-1 so they can be used directly
+        nodes = [
+            [nodes_dict[idx][1], nodes_dict[idx][0]]
+            for idx in range(len(nodes_dict))
+        ]
+        graph = [graph_dict[idx] for idx in range(len(graph_dict))]
+        return GeoGraph(graph=graph, nodes=nodes)
     nodes = [
         [i[1][1], i[1][0]]
         for i in sorted(nodes_dict.items(), key=lambda x: x[0])
@@ -1225,10 +2437,34 @@ def load_geojson_as_geograph(geojson_filename: str) -> GeoGraph:
     return GeoGraph(graph=graph, nodes=nodes)
 
 
+def get_route_line_paths(routes: list[dict]) -> list[dict]:
+    """
+    Function:
+
+    - Get the GeoJSON LineString of the shortest path for each route
+    - This is used by `get_multi_path_geojson` to split the routes across processes
+
+    Required Arguments:
+
+    - `routes`
+        - Type: list of dicts
+        - What: Dictionaries with the keys 'geograph', 'origin' and 'destination' (see `get_multi_path_geojson`)
+    """
+    return [
+        get_line_path(
+            route["geograph"].get_shortest_path(
+                route["origin"], route["destination"]
+            )
+        )
+        for route in routes
+    ]
+
+
 def get_multi_path_geojson(
     routes: list[dict],
     filename: [str, None] = None,
     show_progress: bool = False,
+    processes: int = 1,
 ) -> dict:
     """
     Creates a GeoJSON file with the shortest path between the origin and destination of each route.
@@ -1259,6 +2495,10 @@ def get_multi_path_geojson(
     - `show_progress`: bool
         - Whether to show basic progress information
         - Default: False
+    - `processes`: int
+        - Number of processes to split the routes across
+        - Default: 1
+        - Note: Each process receives a copy of the geographs it needs, so this is only faster when there are many routes per process
 
     Returns
 
@@ -1336,13 +2576,47 @@ def get_multi_path_geojson(
         ]
     ), "All destination longitudes must be between -180 and 180"
 
+    assert (
+        isinstance(processes, int) and processes > 0
+    ), "Processes must be a positive integer"
+
     output = {"type": "FeatureCollection", "features": []}
     len_routes = len(routes)
-    for idx, route in enumerate(routes):
-        shortest_path = route["geograph"].get_shortest_path(
-            route["origin"], route["destination"]
-        )
-        shortest_line_path = get_line_path(shortest_path)
+    if processes > 1:
+        # Send each process one contiguous chunk so a geograph shared by many
+        # routes is only copied once per process
+        chunk_size = max(-(-len_routes // processes), 1)
+        chunks = [
+            [
+                {
+                    "geograph": route["geograph"],
+                    "origin": route["origin"],
+                    "destination": route["destination"],
+                }
+                for route in routes[start : start + chunk_size]
+            ]
+            for start in range(0, len_routes, chunk_size)
+        ]
+        line_paths = []
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for chunk_line_paths in executor.map(get_route_line_paths, chunks):
+                line_paths.extend(chunk_line_paths)
+                if show_progress:
+                    done = len(line_paths)
+                    print(
+                        f"[{'='*(int(done/len_routes*20))}>{' '*(20-int(done/len_routes*20))}] {done}/{len_routes}",
+                        end="\r",
+                    )
+    else:
+        line_paths = []
+        for idx, route in enumerate(routes):
+            line_paths.extend(get_route_line_paths([route]))
+            if show_progress:
+                print(
+                    f"[{'='*(int((idx+1)/len_routes*20))}>{' '*(20-int((idx+1)/len_routes*20))}] {idx+1}/{len_routes}",
+                    end="\r",
+                )
+    for route, shortest_line_path in zip(routes, line_paths):
         output["features"].append(
             {
                 "type": "Feature",
@@ -1350,13 +2624,9 @@ def get_multi_path_geojson(
                 "geometry": shortest_line_path,
             }
         )
-        if show_progress:
-            print(
-                f"[{'='*(int((idx+1)/len_routes*20))}>{' '*(20-int((idx+1)/len_routes*20))}] {idx+1}/{len_routes}",
-                end="\r",
-            )
     if show_progress:
         print()
     if filename is not None:
-        json.dump(output, open(filename, "w"))
+        with open(filename, "w") as f:
+            f.write(json.dumps(output))
     return output
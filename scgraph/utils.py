@@ -2,10 +2,10 @@ import math, json
 
 
 def haversine(
-    origin: list[float|int],
-    destination: list[float|int],
+    origin: list[float | int],
+    destination: list[float | int],
     units: str = "km",
-    circuity: [float|int] = 1,
+    circuity: [float | int] = 1,
 ):
     """
     Function:
@@ -34,18 +34,11 @@ def haversine(
 
     """
     try:
-        # convert decimal degrees to radians
-        lon1, lat1, lon2, lat2 = map(
-            math.radians,
-            [
-                origin[1],
-                origin[0],
-                destination[1],
-                destination[0],
-            ],
-        )
+        # convert decimal degrees to radians (without an intermediate list)
+        lat1 = math.radians(origin[0])
+        lat2 = math.radians(destination[0])
         # haversine formula
-        dlon = lon2 - lon1
+        dlon = math.radians(destination[1]) - math.radians(origin[1])
         dlat = lat2 - lat1
         a = (
             math.sin(dlat / 2) ** 2
@@ -69,7 +62,65 @@ def haversine(
         raise Exception()
 
 
-def hard_round(decimal_places: int, a: [float|int]):
+def haversine_many(
+    origin: list[float | int],
+    destinations: list[list[float | int]],
+    units: str = "km",
+    circuity: [float | int] = 1,
+) -> list[float]:
+    """
+    Function:
+
+    - Calculate the great circle distance between one origin and many destinations on the earth (specified in decimal degrees)
+    - This is equivalent to calling `haversine` for each destination but only computes the origin terms once
+
+    Required Arguments:
+
+    - `origin`:
+        - Type: list of two floats | ints
+        - What: The origin point as a list of "latitude" and "longitude"
+    - `destinations`:
+        - Type: list of lists of two floats | ints
+        - What: The destination points as lists of "latitude" and "longitude"
+
+    Optional Arguments:
+
+    - `units`:
+        - Type: str
+        - What: units to return the distance in? (one of "km", "m", "mi", or "ft")
+        - Default: "km"
+    - `circuity`:
+        - Type: int | float
+        - What: Multiplier to increase the calculated distance (to account for circuity)
+        - Default: 1
+    """
+    if units == "km":
+        radius = 6371
+    elif units == "m":
+        radius = 6371000
+    elif units == "mi":
+        radius = 3959
+    elif units == "ft":
+        radius = 3959 * 5280
+    else:
+        raise ValueError('Units must be one of "km", "m", "mi", or "ft"')
+    radians, sin, cos, asin = math.radians, math.sin, math.cos, math.asin
+    lat1 = radians(origin[0])
+    lon1 = radians(origin[1])
+    cos_lat1 = cos(lat1)
+    output = []
+    for destination in destinations:
+        lat2 = radians(destination[0])
+        dlon = radians(destination[1]) - lon1
+        a = (
+            sin((lat2 - lat1) / 2) ** 2
+            + cos_lat1 * cos(lat2) * sin(dlon / 2) ** 2
+        )
+        output.append(2 * asin(a**0.5) * radius * circuity)
+    return output
+
+
+def hard_round(decimal_places: int, a: [float | int]):
     """
     Function:
 
@@ -90,7 +141,7 @@ def hard_round(decimal_places: int, a: [float|int]):
 
 
 def distance_converter(
-    distance: [float|int], input_units: str, output_units: str
+    distance: [float | int], input_units: str, output_units: str
 ):
     """
     Function:
@@ -43,3 +43,98 @@ validate(
     ),
     expected=expected,
 )
+
+validate(
+    name="Dijkstra-Bidirectional",
+    realized=Graph.dijkstra_bidirectional(
+        graph=graph, origin_id=0, destination_id=5
+    ),
+    expected=expected,
+)
+
+validate(
+    name="Dijkstra-Contraction-Hierarchy",
+    realized=Graph.dijkstra_contraction_hierarchy(
+        graph=graph,
+        origin_id=0,
+        destination_id=5,
+        contraction_hierarchy=Graph.contraction_hierarchy(graph=graph),
+    ),
+    expected=expected,
+)
+
+validate(
+    name="A*",
+    realized=Graph.a_star(graph=graph, origin_id=0, destination_id=5),
+    expected=expected,
+)
+
+validate(
+    name="Shortest Path Tree",
+    realized=Graph.shortest_path_tree(graph=graph, origin_id=0),
+    expected={
+        "origin_id": 0,
+        "predecessor": [None, 2, 0, 1, 3, 3],
+        "distance_matrix": [0, 3, 1, 4, 7, 10],
+    },
+)
+
+validate(
+    name="Dijkstra-Reach",
+    realized=Graph.dijkstra_reach(
+        graph=graph, origin_id=0, destination_ids={4, 5}, forbidden_ids={1}
+    ),
+    expected={"destination_id": 4, "path": [0, 2, 3, 4], "length": 8},
+)
+
+validate(
+    name="Dijkstra-Reach Unreachable",
+    realized=Graph.dijkstra_reach(
+        graph=graph, origin_id=0, destination_ids={5}, forbidden_ids={3}
+    ),
+    expected=None,
+)
+
+validate(
+    name="Dijkstra-Reach No Forbidden Nodes",
+    realized=Graph.dijkstra_reach(
+        graph=graph, origin_id=0, destination_ids={4, 5}
+    ),
+    expected={"destination_id": 4, "path": [0, 2, 1, 3, 4], "length": 7},
+)
+
+validate(
+    name="CSR Conversion",
+    realized=Graph.to_csr(graph=graph),
+    expected={
+        "indptr": [0, 2, 5, 9, 13, 15, 16],
+        "indices": [1, 2, 0, 2, 3, 0, 1, 3, 4, 1, 2, 4, 5, 2, 3, 3],
+        "weights": [5, 1, 5, 2, 1, 1, 2, 4, 8, 1, 4, 3, 6, 8, 3, 6],
+    },
+)
+
+try:
+    Graph.validate_graph(
+        graph=[{1: 1}, {0: 1, 2: 1}, {}], check_connected=False
+    )
+    asymmetric_realized = None
+except AssertionError:
+    asymmetric_realized = "AssertionError"
+
+validate(
+    name="Asymmetric Graph Validation",
+    realized=asymmetric_realized,
+    expected="AssertionError",
+)
+
+try:
+    Graph.dijkstra(graph=graph, origin_id=0, destination_id=len(graph))
+    input_check_realized = None
+except Exception as e:
+    input_check_realized = str(e)
+
+validate(
+    name="Input Check",
+    realized=input_check_realized,
+    expected=f"Destination node ({len(graph)}) is not in the graph",
+)
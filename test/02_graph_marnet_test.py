@@ -45,6 +45,28 @@ validate(
     expected=expected,
 )
 
+validate(
+    name="Dijkstra-Bidirectional",
+    realized=Graph.dijkstra_bidirectional(
+        graph=graph, origin_id=0, destination_id=5
+    ),
+    expected=expected,
+)
+
+validate(
+    name="Dijkstra-Many",
+    realized=Graph.dijkstra_many(
+        graph=graph, origin_ids=[0, 100, 0], destination_ids=[5, 7999, 5]
+    ),
+    expected=[
+        expected,
+        Graph.dijkstra_makowski(
+            graph=graph, origin_id=100, destination_id=7999
+        ),
+        expected,
+    ],
+)
+
 print("\n===============\nMarnet Time Tests:\n===============")
 
 time_test(
@@ -89,3 +111,29 @@ time_test(
         graph=graph, origin_id=4022, destination_id=8342
     ),
 )
+time_test(
+    "Dijkstra-Bidirectional 1",
+    pamda.thunkify(Graph.dijkstra_bidirectional)(
+        graph=graph, origin_id=0, destination_id=5
+    ),
+)
+time_test(
+    "Dijkstra-Bidirectional 2",
+    pamda.thunkify(Graph.dijkstra_bidirectional)(
+        graph=graph, origin_id=100, destination_id=7999
+    ),
+)
+time_test(
+    "Dijkstra-Bidirectional 3",
+    pamda.thunkify(Graph.dijkstra_bidirectional)(
+        graph=graph, origin_id=4022, destination_id=8342
+    ),
+)
+time_test(
+    "Dijkstra-Many",
+    pamda.thunkify(Graph.dijkstra_many)(
+        graph=graph,
+        origin_ids=[0, 100, 4022, 0, 100, 4022],
+        destination_ids=[5, 7999, 8342, 8342, 5, 7999],
+    ),
+)
@@ -58,3 +58,130 @@ validate(
     ),
     expected=expected,
 )
+
+index_graph = GeoGraph(
+    nodes=[list(node) for node in nodes], graph=[dict(i) for i in graph]
+)
+index_graph.get_node_distances(
+    node=[0, 0],
+    circuity=1,
+    node_addition_type="closest",
+    node_addition_math="euclidean",
+    lat_lon_bound=5,
+)
+index_graph.mod_add_node(latitude=10, longitude=10)
+
+validate(
+    name="GeoGraph Node Distances After Node Addition",
+    realized=list(
+        index_graph.get_node_distances(
+            node=[10.5, 10.5],
+            circuity=1,
+            node_addition_type="closest",
+            node_addition_math="euclidean",
+            lat_lon_bound=5,
+        ).keys()
+    ),
+    expected=[6],
+)
+
+cached_output = my_graph.get_shortest_path(
+    origin_node=origin_node, destination_node=destination_node, cache=True
+)
+cached_output["coordinate_path"].append([9, 9])
+
+validate(
+    name="GeoGraph Shortest Path Cached",
+    realized=my_graph.get_shortest_path(
+        origin_node=origin_node, destination_node=destination_node, cache=True
+    ),
+    expected=expected,
+)
+
+cache_graph = GeoGraph(
+    nodes=[list(node) for node in nodes], graph=[dict(i) for i in graph]
+)
+cache_graph.get_shortest_path(
+    origin_node=origin_node, destination_node=destination_node, cache=True
+)
+cache_graph.mod_remove_arc(origin_idx=1, destination_idx=3)
+
+validate(
+    name="GeoGraph Shortest Path Cache Cleared On Modification",
+    realized=cache_graph.get_shortest_path(
+        origin_node=origin_node, destination_node=destination_node, cache=True
+    ),
+    expected={
+        "coordinate_path": [[0, 0], [0, 0], [1, 0], [1, 1], [2, 1], [2, 1]],
+        "length": 11,
+    },
+)
+
+for output_units in ["km", "mi", "m"]:
+    cache_graph.get_shortest_path(
+        origin_node=origin_node,
+        destination_node=destination_node,
+        output_units=output_units,
+        cache=True,
+        cache_size=2,
+    )
+
+validate(
+    name="GeoGraph Shortest Path Cache Size",
+    realized=[key[4] for key in cache_graph.shortest_path_cache],
+    expected=["mi", "m"],
+)
+
+cache_graph.get_shortest_path(
+    origin_node={"latitude": 0.0000001, "longitude": 0},
+    destination_node=destination_node,
+    output_units="m",
+    cache=True,
+    cache_size=2,
+)
+
+validate(
+    name="GeoGraph Shortest Path Cache Rounded Coordinates",
+    realized=[key[4] for key in cache_graph.shortest_path_cache],
+    expected=["mi", "m"],
+)
+
+a_star_kwargs = {}
+cache_graph.get_shortest_path(
+    origin_node=origin_node,
+    destination_node=destination_node,
+    algorithm_fn=Graph.a_star,
+    algorithm_kwargs=a_star_kwargs,
+)
+
+validate(
+    name="GeoGraph Shortest Path Algorithm Kwargs Unchanged",
+    realized=a_star_kwargs,
+    expected={},
+)
+
+landmark_graph = GeoGraph(
+    nodes=[list(node) for node in nodes], graph=[dict(i) for i in graph]
+)
+landmark_graph.precompute_landmarks(landmark_count=2)
+landmark_origin_id = landmark_graph.add_node(node=origin_node, circuity=4)
+landmark_destination_id = landmark_graph.add_node(
+    node=destination_node, circuity=4, node_addition_type="all"
+)
+
+validate(
+    name="GeoGraph Landmark Heuristic With Added Nodes",
+    realized=[
+        landmark_graph.landmark_heuristic(node_id, landmark_destination_id)
+        for node_id in range(len(landmark_graph.graph))
+    ],
+    expected=[10, 7, 9, 6, 9, 0, 10, 0],
+)
+
+landmark_graph.mod_add_arc(origin_idx=0, destination_idx=5, distance=1)
+
+validate(
+    name="GeoGraph Landmarks Cleared On Modification",
+    realized=landmark_graph.landmark_distances,
+    expected=[],
+)
@@ -78,6 +78,80 @@ validate(
     expected=expected,
 )
 
+validate(
+    name="A*-Haversine",
+    realized=marnet_geograph.get_shortest_path(
+        origin_node=origin_node,
+        destination_node=destination_node,
+        algorithm_fn=Graph.a_star,
+        algorithm_kwargs={"heuristic_fn": marnet_geograph.haversine},
+    ),
+    expected=expected,
+)
+
+validate(
+    name="A*-Default-Heuristic",
+    realized=marnet_geograph.get_shortest_path(
+        origin_node=origin_node,
+        destination_node=destination_node,
+        algorithm_fn=Graph.a_star,
+    ),
+    expected=expected,
+)
+
+marnet_geograph.precompute_landmarks(landmark_count=4)
+
+validate(
+    name="A*-Landmark",
+    realized=marnet_geograph.get_shortest_path(
+        origin_node=origin_node,
+        destination_node=destination_node,
+        algorithm_fn=Graph.a_star,
+        algorithm_kwargs={"heuristic_fn": marnet_geograph.landmark_heuristic},
+    ),
+    expected=expected,
+)
+
+# No nodes are within the lat_lon_bound of this node, so all nodes are checked
+validate(
+    name="Node Distances Empty Bound Closest",
+    realized=marnet_geograph.get_node_distances(
+        node=[-77.33, -174.76],
+        circuity=4,
+        node_addition_type="closest",
+        node_addition_math="haversine",
+        lat_lon_bound=1,
+    ),
+    expected={4692: 1383.6494},
+)
+
+validate(
+    name="Node Distances Empty Bound Quadrant",
+    realized=marnet_geograph.get_node_distances(
+        node=[-77.33, -174.76],
+        circuity=4,
+        node_addition_type="quadrant",
+        node_addition_math="haversine",
+        lat_lon_bound=1,
+    ),
+    expected={4692: 1383.6494, 5440: 3322.2689},
+)
+
+# A lat_lon_bound of 180 covers the globe, even across the antimeridian
+validate(
+    name="Node Distances Globe Bound",
+    realized=len(
+        marnet_geograph.get_node_distances(
+            node=[40, 150],
+            circuity=4,
+            node_addition_type="all",
+            node_addition_math="haversine",
+            lat_lon_bound=180,
+        )
+    ),
+    expected=len(marnet_geograph.nodes),
+)
+
 print("\n===============\nMarnet GeoGraph Time Tests:\n===============")
 
 time_test(
@@ -108,7 +182,17 @@ def dijkstra_makowski():
     )
 
 
+def a_star():
+    marnet_geograph.get_shortest_path(
+        origin_node=origin_node,
+        destination_node=destination_node,
+        algorithm_fn=Graph.a_star,
+        algorithm_kwargs={"heuristic_fn": marnet_geograph.haversine},
+    )
+
+
 time_test("Dijkstra", dijkstra)
 time_test("Dijkstra-Makowski", dijkstra_makowski)
+time_test("A*-Haversine", a_star)
 
 # marnet_geograph.save_as_geojson('marnet.geojson')
@@ -89,6 +89,18 @@ validate(
     expected=expected,
 )
 
+us_freeway_geograph.precompute_contraction_hierarchy()
+
+validate(
+    name="Dijkstra-Contraction-Hierarchy",
+    realized=us_freeway_geograph.get_shortest_path(
+        origin_node=origin_node,
+        destination_node=destination_node,
+        algorithm_fn=Graph.dijkstra_contraction_hierarchy,
+    ),
+    expected=expected,
+)
+
 print("\n===============\nUS Freeway GeoGraph Time Tests:\n===============")
 
 time_test(
@@ -121,7 +133,20 @@ def dijkstra_makowski():
     )
 
 
+def dijkstra_contraction_hierarchy():
+    us_freeway_geograph.get_shortest_path(
+        origin_node=origin_node,
+        destination_node=destination_node,
+        algorithm_fn=Graph.dijkstra_contraction_hierarchy,
+    )
+
+
 time_test("Dijkstra", dijkstra)
 time_test("Dijkstra-Makowski", dijkstra_makowski)
+time_test("Dijkstra-Contraction-Hierarchy", dijkstra_contraction_hierarchy)
+time_test(
+    "Contraction Hierarchy Preprocessing",
+    us_freeway_geograph.precompute_contraction_hierarchy,
+)
 
 # us_freeway_geograph.save_as_geojson('us_freeway_geograph.geojson')
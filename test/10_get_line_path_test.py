@@ -13,3 +13,35 @@ try:
     # get_line_path(output, filename='test.json')
 except Exception:
     print("Get Line Path: FAIL")
+
+if __name__ == "__main__":
+    # Guarded so spawned worker processes do not rerun this block on import
+    from scgraph.core import get_multi_path_geojson
+
+    routes = [
+        {
+            "geograph": marnet_geograph,
+            "origin": {"latitude": 31.23, "longitude": 121.47},
+            "destination": {"latitude": 32.08, "longitude": -81.09},
+            "properties": {"id": "SHG_SAV"},
+        },
+        {
+            "geograph": marnet_geograph,
+            "origin": {"latitude": 51.95, "longitude": 4.14},
+            "destination": {"latitude": 1.29, "longitude": 103.85},
+            "properties": {"id": "RTM_SIN"},
+        },
+        {
+            "geograph": marnet_geograph,
+            "origin": origin_node,
+            "destination": destination_node,
+            "properties": {"id": "PACIFIC"},
+        },
+    ]
+
+    try:
+        assert get_multi_path_geojson(
+            routes=routes, processes=2
+        ) == get_multi_path_geojson(routes=routes, processes=1)
+    except Exception:
+        print("Get Multi Path GeoJSON With Processes: FAIL")
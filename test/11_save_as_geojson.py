@@ -37,6 +37,25 @@ try:
 except:
     print("FAIL")
 
+# Node idxs that are not exactly 0 to n-1 should be remapped in sorted order
+import json
+
+with open("11_save_as_geojson_test.geojson") as f:
+    geojson = json.load(f)
+for feature in geojson["features"]:
+    feature["properties"]["origin_idx"] += 1
+    feature["properties"]["destination_idx"] += 1
+with open("11_save_as_geojson_test.geojson", "w") as f:
+    json.dump(geojson, f)
+
+my_graph3 = load_geojson_as_geograph("11_save_as_geojson_test.geojson")
+
+try:
+    assert my_graph.graph == my_graph3.graph, "Graphs are not equal"
+    assert my_graph.nodes == my_graph3.nodes, "Nodes are not equal"
+except:
+    print("FAIL")
+
 # Cleanup
 import os
 